@@ -31,6 +31,16 @@ import os
 import voluptuous as vol
 
 
+# Home Assistant manages its own event loop, so uvloop is strictly opt-in for standalone runs of the integration.
+if os.environ.get("OLARM_UVLOOP"):
+    try:
+        import uvloop
+
+        uvloop.install()
+
+    except ImportError:
+        pass
+
 path = os.path.abspath(__file__).replace("__init__.py", "")
 PLATFORMS = [
     ALARM_CONTROL_PANEL_DOMAIN,
@@ -47,7 +57,12 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
 
     # Getting the devices assosiated with the users account.
     setup_api = OlarmSetupApi(api_key=config_entry.data[CONF_API_KEY])
-    devices = await setup_api.get_olarm_devices()
+    try:
+        devices = await setup_api.get_olarm_devices()
+
+    finally:
+        await setup_api.async_close()
+
     device_len_changed = False
 
     if len(devices) > int(config_entry.data[OLARM_DEVICE_AMOUNT]):
@@ -99,6 +114,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
             api_key=config_entry.data[CONF_API_KEY],
         )
 
+        # Tracking the instance under this entry so the session it opens for service calls is closed at unload.
+        hass.data[DOMAIN].setdefault(config_entry.entry_id, {}).setdefault(
+            "api_instances", []
+        ).append(OLARM_API)
+
         filedata = []
         filedata.append(
             f"{device_name_for_ha}_bypass_zone:\n  description: Send a request to Olarm to bypass the zone on {device['deviceName']}.\n  fields:\n    zone_num:\n      description: 'Zone Number (Can be found under state attributes for the specified zone.)'\n      example: '1'\n      required: true\n"
@@ -146,6 +166,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
             ]
         )
     )
+
+    # Closing every api session this entry opened (service handlers and coordinator apis); other entries keep theirs.
+    entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, {})
+    for api in entry_data.get("api_instances", []):
+        await api.async_close()
+
     return unloaded
 
 
@@ -158,7 +184,11 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
 async def update_listener(hass: HomeAssistant, config_entry):
     """Handle options update."""
     setup_api = OlarmSetupApi(api_key=config_entry.data[CONF_API_KEY])
-    devices = await setup_api.get_olarm_devices()
+    try:
+        devices = await setup_api.get_olarm_devices()
+
+    finally:
+        await setup_api.async_close()
 
     try:
         if (
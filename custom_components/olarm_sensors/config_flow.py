@@ -63,7 +63,11 @@ class OlarmSensorsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             try:
                 api = OlarmSetupApi(api_key)
-                json = await api.get_olarm_devices()
+                try:
+                    json = await api.get_olarm_devices()
+
+                finally:
+                    await api.async_close()
 
             except APIForbiddenError:
                 LOGGER.warning(
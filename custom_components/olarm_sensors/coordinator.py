@@ -45,6 +45,11 @@ class OlarmCoordinator(DataUpdateCoordinator):
 
         # Instansiating a local instance of the Olarm API
         self.api = OlarmApi(device_id=device_id, api_key=entry.data[CONF_API_KEY])
+
+        # Registering the api under this entry so its session is closed when the entry is unloaded.
+        hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {}).setdefault(
+            "api_instances", []
+        ).append(self.api)
         self.last_update = datetime.now() - timedelta(minutes=30)
 
         # Setting the nessecary class variables and lists.
@@ -70,9 +75,13 @@ class OlarmCoordinator(DataUpdateCoordinator):
         Called to update the data for the integration from Olarm's API.
         """
         try:
-            # Getting all the devices for your Olarm Account.
+            # Getting all the devices for your Olarm Account. Only genuinely new devices get a coordinator; replacing existing ones would orphan the entity-attached coordinators and their api sessions.
             devices = await self.api.get_all_devices()
+            self.hass.data.setdefault(DOMAIN, {})
             for device in devices:
+                if device["deviceId"] in self.hass.data[DOMAIN]:
+                    continue
+
                 coordinator = OlarmCoordinator(
                     self.hass,
                     entry=self.entry,
@@ -81,8 +90,10 @@ class OlarmCoordinator(DataUpdateCoordinator):
                     device_make=device["deviceAlarmType"],
                 )
 
-                self.hass.data.setdefault(DOMAIN, {})
                 self.hass.data[DOMAIN][device["deviceId"]] = coordinator
+
+            # A failed fetch returns an empty list; keep the known devices so the platform setups are not starved.
+            if devices:
                 self.hass.data[DOMAIN]["devices"] = devices
         
         except ClientConnectorError as ex:
@@ -93,22 +104,22 @@ class OlarmCoordinator(DataUpdateCoordinator):
             # Checking if the device is online.
             self.device_online = devices_json["deviceStatus"].lower() == "online"
             
-            # Getting the sesor states for each zone.
-            self.data = await self.api.get_sensor_states(devices_json)
+            # Getting the sensor, bypass and area states in one pass over the device json.
+            (
+                self.data,
+                self.bypass_data,
+                self.panel_data,
+            ) = await self.api.build_snapshot(devices_json)
             self.sensor_data = self.data
-
-            # Getting the Area Information
-            self.panel_data = await self.api.get_panel_states(devices_json)
             self.panel_state = self.panel_data
-
-            # Getting the Bypass Information
-            self.bypass_data = await self.api.get_sensor_bypass_states(devices_json)
             self.bypass_state = self.bypass_data
 
             try:
-                # Getting the device profile
-                for i in range(devices_json["deviceProfile"]["areasLimit"]):
-                    change_json = await self.api.get_changed_by_json(i + 1)
+                # Getting the device profile. The changed-by lookups are independent per area, so they are fetched concurrently.
+                area_count = devices_json["deviceProfile"]["areasLimit"]
+                change_jsons = await self.api.get_changed_by_all(area_count)
+                for i in range(area_count):
+                    change_json = change_jsons[i]
                     self.last_changed[i + 1] = datetime.strptime(
                         time.ctime(
                             int(devices_json["deviceState"]["areasStamp"][i - 1] / 1000)
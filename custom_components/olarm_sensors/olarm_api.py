@@ -1,9 +1,45 @@
 """Module to interact with the Olarm API."""
 import aiohttp
+import asyncio
+import logging
 import time
+import yarl
 from .const import LOGGER
-from .exceptions import APIClientConnectorError, ListIndexError, DictionaryKeyError, APINotFoundError
-from datetime import datetime, timedelta
+from .exceptions import ListIndexError, DictionaryKeyError, APINotFoundError
+from datetime import datetime, timedelta, timezone
+
+try:
+    # orjson parses the device json a few times faster than the stdlib.
+    import orjson
+
+    _loads = orjson.loads
+
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+# Actions that never change the armed state of an area, filtered out when looking up who changed an area last.
+_EXCLUDED_CMDS = frozenset(
+    ("zone-bypass", "pgm-open", "pgm-close", "pgm-pulse", "ukey-activate")
+)
+
+# Raw state characters from the device json, checked by membership so the hot loops avoid str() and .lower() per zone.
+_ZONE_ACTIVE = frozenset("aA")
+_ZONE_BYPASSED = frozenset("bB")
+_PGM_ON = frozenset("aA")
+
+# Olarm reports in South African time (UTC+2); timestamps are rendered in that zone with a single strftime per zone.
+_OLARM_TZ = timezone(timedelta(hours=2))
+_TS_FMT = "%a %d %b %Y %X"
+
+# Maps the area verbs to the Olarm action commands for the single area_action dispatch path.
+_AREA_ACTIONS = {
+    "arm": "area-arm",
+    "sleep": "area-sleep",
+    "stay": "area-stay",
+    "disarm": "area-disarm",
+}
 
 
 class OlarmApi:
@@ -14,12 +50,31 @@ class OlarmApi:
         \tapi_key (str): The key can be passed in an authorization header to authenticate to Olarm.
     """
 
-    def __init__(self, device_id, api_key) -> None:
+    __slots__ = (
+        "device_id",
+        "api_key",
+        "data",
+        "bypass_data",
+        "panel_data",
+        "devices",
+        "headers",
+        "cache_ttl",
+        "_session",
+        "_devices_cache",
+        "_devices_cache_ts",
+        "_devices_cache_lock",
+        "_url_device",
+        "_url_actions",
+        "_url_devices",
+    )
+
+    def __init__(self, device_id, api_key, cache_ttl=3.0) -> None:
         """
         Initatiates a connection to the Olarm API.
         params:
         \tdevice_id (str): UUID for the Olarm device.
         \tapi_key (str): The key can be passed in an authorization header to authenticate to Olarm.
+        \tcache_ttl (float): How long (seconds) a fetched device json may be served from memory.
         """
         self.device_id = device_id
         self.api_key = api_key
@@ -28,24 +83,84 @@ class OlarmApi:
         self.panel_data = []
         self.devices = []
         self.headers = {"Authorization": f"Bearer {api_key}"}
+        self._session: aiohttp.ClientSession | None = None
+        self.cache_ttl = cache_ttl
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+        self._devices_cache_lock = asyncio.Lock()
+        # Parsed once here so aiohttp does not re-parse a freshly formatted url string on every request.
+        self._url_device = yarl.URL(
+            f"https://apiv4.olarm.co/api/v4/devices/{device_id}"
+        )
+        self._url_actions = self._url_device / "actions"
+        self._url_devices = yarl.URL("https://apiv4.olarm.co/api/v4/devices")
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared aiohttp session for this device, creating it on first use. Reusing one session keeps the connection to the Olarm API alive instead of doing a new TCP and TLS handshake for every request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=10, keepalive_timeout=75, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+            )
+
+        return self._session
+
+    async def async_close(self) -> None:
+        """
+        Closes the shared aiohttp session. Called when the integration is unloaded.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
 
     async def get_device_json(self) -> dict:
         """
-        This method gets and returns the data from the Olarm API for a spesific device:
+        This method gets and returns the data from the Olarm API for a spesific device. Responses are cached in memory for cache_ttl seconds so burst reads within one update cycle do not each hit the network:
 
         return:\tdict\tThe info associated with a device
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://apiv4.olarm.co/api/v4/devices/{self.device_id}",
-                    headers=self.headers,
-                ) as response:
-                    return await response.json()
+        if (
+            self._devices_cache is not None
+            and time.monotonic() - self._devices_cache_ts < self.cache_ttl
+        ):
+            return self._devices_cache
+
+        async with self._devices_cache_lock:
+            # Another caller might have refreshed the cache while we waited.
+            if (
+                self._devices_cache is not None
+                and time.monotonic() - self._devices_cache_ts < self.cache_ttl
+            ):
+                return self._devices_cache
+
+            for attempt in range(2):
+                try:
+                    session = await self._get_session()
+                    async with session.get(self._url_device) as response:
+                        device_json = _loads(await response.read())
+                        self._devices_cache = device_json
+                        self._devices_cache_ts = time.monotonic()
+                        return device_json
+
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+                    if attempt == 1:
+                        LOGGER.error("Olarm API Devices error\n%s", ex)
+                        return {}
 
-        except APIClientConnectorError as ex:
-            LOGGER.error("Olarm API Devices error\n%s", ex)
-            return {}
+                    await asyncio.sleep(0.25 * 2**attempt)
+
+    def invalidate_devices_cache(self) -> None:
+        """
+        Drops the cached device json so the next read refetches. Called after state-changing actions to avoid serving stale data.
+        """
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
 
     async def get_changed_by_json(self, area) -> dict:
         """
@@ -53,42 +168,51 @@ class OlarmApi:
         return (str):\tThe user that triggered tha last state change of an area.
         """
         return_data = {"userFullname": "No User", "actionCreated": 0, "actionCmd": None}
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://apiv4.olarm.co/api/v4/devices/{self.device_id}/actions",
-                    headers=self.headers,
-                ) as response:
+        for attempt in range(2):
+            try:
+                session = await self._get_session()
+                async with session.get(self._url_actions) as response:
                     if response.status == 404:
                         LOGGER.error("Olarm API actions endpoint returned 404")
                         return return_data
 
-                    changes = await response.json()
+                    changes = _loads(await response.read())
+                    area = int(area)
                     for change in changes:
                         if (
-                            change["actionCmd"]
-                            not in [
-                                "zone-bypass",
-                                "pgm-open",
-                                "pgm-close",
-                                "pgm-pulse",
-                                "ukey-activate",
-                            ]
-                            and int(change["actionNum"]) == int(area)
-                            and return_data["actionCreated"]
+                            int(change["actionNum"]) == area
+                            and int(return_data["actionCreated"])
                             < int(change["actionCreated"])
+                            and change["actionCmd"] not in _EXCLUDED_CMDS
                         ):
                             return_data = change
 
                     return return_data
 
-        except APIClientConnectorError as ex:
-            LOGGER.error("Olarm API Changed By error\n%s", ex)
-            return return_data
-        
-        except APINotFoundError as ex:
-            LOGGER.error("Olarm API Changed By error\n%s", ex)
-            return return_data
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+                if attempt == 1:
+                    LOGGER.error("Olarm API Changed By error\n%s", ex)
+                    return return_data
+
+                await asyncio.sleep(0.25 * 2**attempt)
+
+            except APINotFoundError as ex:
+                LOGGER.error("Olarm API Changed By error\n%s", ex)
+                return return_data
+
+        return return_data
+
+    async def get_changed_by_all(self, area_count) -> list:
+        """
+        DOCSTRING:\tFetches the changed-by data for every area concurrently over the shared session, so the fan-out completes in one round trip instead of one per area.
+
+        params:\n\tarea_count (int): The number of areas set up on the alarm panel.
+
+        return (list):\tThe changed-by json for areas 1 to area_count.
+        """
+        return await asyncio.gather(
+            *(self.get_changed_by_json(area + 1) for area in range(area_count))
+        )
 
     async def check_credentials(self) -> dict:
         """
@@ -98,49 +222,54 @@ class OlarmApi:
         """
         return await self.get_devices_json()
 
-    async def get_sensor_states(self, devices_json) -> list:
+    async def build_snapshot(self, devices_json) -> tuple:
         """
-        DOCSTRING:\tGets the state for each zone for each area of your alarm panel.
+        DOCSTRING:\tBuilds the zone sensor, bypass sensor and panel area data from one device json in a single pass over the zone arrays, so the shared timestamp and label work is done once per zone.
 
         params:\n\t device_json (dict): The device json from get_devices_json.
 
-        return:\tList:\t A sensor for each zone in each area of the alarm panel. As well as the power states.
+        return:\ttuple:\t(sensor data, bypass data, panel data) as returned by the individual get_* methods.
         """
         olarm_state = devices_json["deviceState"]
         olarm_zones = devices_json["deviceProfile"]
 
         self.data = []
+        self.bypass_data = []
+        self.panel_data = []
 
         try:
-            for zone in range(0, olarm_zones["zonesLimit"]):
-                if str(olarm_state["zones"][zone]).lower() == "a":
-                    state = "on"
-
-                else:
-                    state = "off"
+            zones = olarm_state["zones"]
+            stamps = olarm_state["zonesStamp"]
+            labels = olarm_zones["zonesLabels"]
+            types = olarm_zones["zonesTypes"]
+            n_labels = len(labels)
+            data_append = self.data.append
+            bypass_append = self.bypass_data.append
+
+            for zone, (zone_state, stamp) in enumerate(
+                zip(zones[: olarm_zones["zonesLimit"]], stamps)
+            ):
+                state = "on" if zone_state in _ZONE_ACTIVE else "off"
+                bypass_state = "on" if zone_state in _ZONE_BYPASSED else "off"
 
                 try:
-                    last_changed = datetime.strptime(
-                        time.ctime(int(olarm_state["zonesStamp"][zone]) / 1000),
-                        "%a %b  %d %X %Y",
-                    )
-                    last_changed = last_changed.strftime("%a %d %b %Y %X")
-                
+                    last_changed = datetime.fromtimestamp(
+                        int(stamp) // 1000, _OLARM_TZ
+                    ).strftime(_TS_FMT)
+
                 except TypeError:
                     last_changed = None
 
-                if zone < len(olarm_zones["zonesLabels"]) and (
-                    olarm_zones["zonesLabels"][zone]
-                    or olarm_zones["zonesLabels"][zone] == ""
-                ):
-                    zone_name = olarm_zones["zonesLabels"][zone]
-                    zone_type = olarm_zones["zonesTypes"][zone]
+                label = labels[zone] if zone < n_labels else ""
+                if label and label.strip():
+                    zone_name = label
+                    zone_type = types[zone]
 
                 else:
                     zone_name = f"Zone {zone + 1}"
                     zone_type = 0
 
-                self.data.append(
+                data_append(
                     {
                         "name": zone_name,
                         "state": state,
@@ -149,8 +278,17 @@ class OlarmApi:
                         "zone_number": zone
                     }
                 )
-            
-            zone = zone + 1
+                bypass_append(
+                    {
+                        "name": zone_name,
+                        "state": bypass_state,
+                        "last_changed": last_changed,
+                        "zone_number": zone
+                    }
+                )
+
+            # The power sensors continue numbering after the zones; len covers the case where the zone arrays were empty.
+            zone = len(self.data)
             for key, value in olarm_state["power"].items():
                 sensortype = 1000
                 if int(value) == 1:
@@ -162,8 +300,8 @@ class OlarmApi:
                 if key == "Batt":
                     key = "Battery"
                     sensortype = 1001
-                    
-                self.data.append(
+
+                data_append(
                     {
                         "name": f"Powered by {key}",
                         "state": state,
@@ -174,62 +312,60 @@ class OlarmApi:
                 )
                 zone = zone + 1
 
-            return self.data
-
         except (DictionaryKeyError, KeyError, IndexError, ListIndexError) as ex:
             LOGGER.error("Olarm Bypass sensors error:\n%s", ex)
-            return self.data
-
-    async def get_sensor_bypass_states(self, devices_json) -> list:
-        """
-        DOCSTRING:\tGets the bypass state for each zone for each area of your alarm panel.
-
-        params:\n\t device_json (dict): The device json from get_devices_json.
-
-        return:\tList:\t A sensor for each zone's bypass state in each area of the alarm panel.
-        """
-        olarm_state = devices_json["deviceState"]
-        olarm_zones = devices_json["deviceProfile"]
 
-        self.bypass_data = []
         try:
-            for zone in range(0, olarm_zones["zonesLimit"]):
-                if str(olarm_state["zones"][zone]).lower() == "b":
-                    state = "on"
+            area_labels = olarm_zones["areasLabels"]
+            area_count = olarm_zones["areasLimit"]
+            areas = olarm_state["areas"]
+            n_areas = len(areas)
+            n_area_labels = len(area_labels)
+
+            if n_area_labels < area_count or "" in area_labels[:area_count]:
+                LOGGER.warn(
+                    "This device's area names have not been set up in Olarm, generating automatically"
+                )
 
-                else:
-                    state = "off"
+            self.panel_data = [
+                {
+                    "name": (
+                        area_labels[area_num]
+                        if area_num < n_area_labels and area_labels[area_num]
+                        else f"Area {area_num + 1}"
+                    ),
+                    "state": areas[area_num],
+                    "area_number": area_num + 1
+                }
+                for area_num in range(min(area_count, n_areas))
+            ]
 
-                last_changed = datetime.strptime(
-                    time.ctime(int(olarm_state["zonesStamp"][zone]) / 1000),
-                    "%a %b  %d %X %Y",
-                ) + timedelta(hours=2)
+        except (DictionaryKeyError, KeyError, IndexError, ListIndexError) as ex:
+            LOGGER.error("Olarm API Panel error:\n%s", ex)
 
-                last_changed = last_changed.strftime("%a %d %b %Y %X")
+        return self.data, self.bypass_data, self.panel_data
 
-                if zone < len(olarm_zones["zonesLabels"]) and (
-                    olarm_zones["zonesLabels"][zone]
-                    or olarm_zones["zonesLabels"][zone] == ""
-                ):
-                    zone_name = olarm_zones["zonesLabels"][zone]
+    async def get_sensor_states(self, devices_json) -> list:
+        """
+        DOCSTRING:\tGets the state for each zone for each area of your alarm panel.
 
-                else:
-                    zone_name = f"Zone {zone + 1}"
+        params:\n\t device_json (dict): The device json from get_devices_json.
 
-                self.bypass_data.append(
-                    {
-                        "name": zone_name,
-                        "state": state,
-                        "last_changed": last_changed,
-                        "zone_number": zone
-                    }
-                )
+        return:\tList:\t A sensor for each zone in each area of the alarm panel. As well as the power states.
+        """
+        sensor_data, _, _ = await self.build_snapshot(devices_json)
+        return sensor_data
+
+    async def get_sensor_bypass_states(self, devices_json) -> list:
+        """
+        DOCSTRING:\tGets the bypass state for each zone for each area of your alarm panel.
 
-            return self.bypass_data
+        params:\n\t device_json (dict): The device json from get_devices_json.
 
-        except (DictionaryKeyError, KeyError, IndexError, ListIndexError) as ex:
-            LOGGER.error("Olarm Bypass sensors error:\n%s", ex)
-            return self.bypass_data
+        return:\tList:\t A sensor for each zone's bypass state in each area of the alarm panel.
+        """
+        _, bypass_data, _ = await self.build_snapshot(devices_json)
+        return bypass_data
 
     async def get_panel_states(self, devices_json) -> list:
         """
@@ -238,34 +374,8 @@ class OlarmApi:
 
         return: (list):\tThe state for each are of the alarm panel.
         """
-        olarm_state = devices_json["deviceState"]
-        zones = devices_json["deviceProfile"]
-        olarm_zones = zones["areasLabels"]
-
-        self.panel_data = []
-
-        area_count = zones["areasLimit"]
-        for area_num in range(area_count):
-            try:
-                if olarm_zones[area_num] == "":
-                    LOGGER.warn(
-                        "This device's area names have not been set up in Olarm, generating automatically"
-                    )
-                    olarm_zones[area_num] = f"Area {area_num + 1}"
-
-                if len(olarm_state["areas"]) > area_num:
-                    self.panel_data.append(
-                        {
-                            "name": f"{olarm_zones[area_num]}",
-                            "state": olarm_state["areas"][area_num],
-                            "area_number": area_num + 1
-                        }
-                    )
-
-            except (DictionaryKeyError, KeyError) as ex:
-                LOGGER.error("Olarm API Panel error:\n%s", ex)
-
-        return self.panel_data
+        _, _, panel_data = await self.build_snapshot(devices_json)
+        return panel_data
 
     async def get_pgm_zones(self, devices_json) -> list:
         """
@@ -288,21 +398,24 @@ class OlarmApi:
             return []
 
         pgms = []
+        pgms_append = pgms.append
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
         try:
-            for i in range(0, pgm_limit):
-                state = str(pgm_state[i]).lower() == "a"
+            for i in range(pgm_limit):
+                state = pgm_state[i] in _PGM_ON
                 name = pgm_labels[i]
-                if pgm_setup[i] == "":
+                setup = pgm_setup[i]
+                if setup == "":
                     continue
 
                 try:
-                    enabled = pgm_setup[i][0] == "1"
+                    enabled = setup[0] == "1"
 
                 except ListIndexError:
                     continue
 
                 try:
-                    pulse = pgm_setup[i][2] == "1"
+                    pulse = setup[2] == "1"
 
                 except ListIndexError:
                     continue
@@ -310,12 +423,13 @@ class OlarmApi:
                 number = i + 1
 
                 if name == "":
-                    LOGGER.debug(
-                        "PGM name not set. Generating automatically. PGM %s", number
-                    )
+                    if debug_enabled:
+                        LOGGER.debug(
+                            "PGM name not set. Generating automatically. PGM %s", number
+                        )
                     name = f"PGM {number}"
 
-                pgms.append(
+                pgms_append(
                     {
                         "name": name,
                         "enabled": enabled,
@@ -341,21 +455,24 @@ class OlarmApi:
         ukey_limit = devices_json["deviceProfile"]["ukeysLimit"]
         ukey_state = devices_json["deviceProfile"]["ukeysControl"]
         ukeys = []
+        ukeys_append = ukeys.append
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
         try:
-            for i in range(0, ukey_limit):
+            for i in range(ukey_limit):
                 try:
                     state = int(ukey_state[i]) == 1
                     name = ukey_labels[i]
                     number = i + 1
 
                     if name == "":
-                        LOGGER.debug(
-                            "Ukey name not set. Generating automatically. Ukey %s",
-                            number,
-                        )
+                        if debug_enabled:
+                            LOGGER.debug(
+                                "Ukey name not set. Generating automatically. Ukey %s",
+                                number,
+                            )
                         name = f"Ukey {number}"
 
-                    ukeys.append({"name": name, "state": state, "ukey_number": number})
+                    ukeys_append({"name": name, "state": state, "ukey_number": number})
 
                 except (DictionaryKeyError, KeyError) as ex:
                     LOGGER.error("Olarm Ukey Error:\n%s", ex)
@@ -377,23 +494,29 @@ class OlarmApi:
         DOCSTRING:\tSends an action to the Olarm API to perform an action on the device.
         params:\n\tpost_data (dict): The area to perform the action to. As well as the action.
         """
-        try:
-            async with aiohttp.ClientSession() as session:
+        for attempt in range(2):
+            try:
+                session = await self._get_session()
                 async with session.post(
-                    url=f"https://apiv4.olarm.co/api/v4/devices/{self.device_id}/actions",
+                    url=self._url_actions,
                     data=post_data,
-                    headers=self.headers,
                 ) as response:
-                    resp = await response.json()
-                    return str(resp["actionStatus"]).lower() == "ok"
+                    resp = _loads(await response.read())
+                    self.invalidate_devices_cache()
+                    return resp.get("actionStatus", "").lower() == "ok"
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+                if attempt == 1:
+                    LOGGER.error(
+                        "Olarm API update zone error:\nCould not set action:\t %s due to error:\n%s",
+                        post_data,
+                        ex,
+                    )
+                    return False
 
-        except APIClientConnectorError as ex:
-            LOGGER.error(
-                "Olarm API update zone error:\nCould not set action:\t %s due to error:\n%s",
-                post_data,
-                ex,
-            )
-            return False
+                await asyncio.sleep(0.25 * 2**attempt)
+
+        return False
 
     async def update_pgm(self, pgm_data) -> bool:
         """
@@ -403,7 +526,7 @@ class OlarmApi:
         try:
             return await self.send_action(pgm_data)
 
-        except APIClientConnectorError as ex:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             LOGGER.error(
                 "Olarm API update pgm error:\nCould not set action:\t %s due to error:\n%s",
                 pgm_data,
@@ -419,7 +542,7 @@ class OlarmApi:
         try:
             return await self.send_action(ukey_data)
 
-        except APIClientConnectorError as ex:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             LOGGER.error(
                 "Olarm API update ukey error:\nCould not set action:\t %s due to error:\n%s",
                 ukey_data,
@@ -427,37 +550,51 @@ class OlarmApi:
             )
             return False
 
+    async def area_action(self, verb, area=None) -> bool:
+        """
+        Sends the request to send_action to perform an action on an area.
+        params:\n\tverb (str): One of arm, sleep, stay or disarm.
+        \tarea (int): The number of the area to apply the action to.
+        """
+        post_data = {"actionCmd": _AREA_ACTIONS[verb], "actionNum": area}
+        return await self.send_action(post_data)
+
+    async def area_actions_bulk(self, ops) -> list:
+        """
+        Performs several area actions concurrently over the shared session.
+        params:\n\tops (list): (verb, area) pairs to perform.
+        """
+        return await asyncio.gather(
+            *(self.area_action(verb, area) for verb, area in ops)
+        )
+
     async def arm_area(self, area=None) -> bool:
         """
         Sends the request to send_action to arm an area.
         params:\n\tarea (int): The number of the area to apply the zone to.
         """
-        post_data = {"actionCmd": "area-arm", "actionNum": area}
-        return await self.send_action(post_data)
+        return await self.area_action("arm", area)
 
     async def sleep_area(self, area=None) -> bool:
         """
-        Sends the request to send_action to arm an area.
+        Sends the request to send_action to sleep an area.
         params:\n\tarea (int): The number of the area to apply the zone to.
         """
-        post_data = {"actionCmd": "area-sleep", "actionNum": area}
-        return await self.send_action(post_data)
+        return await self.area_action("sleep", area)
 
     async def stay_area(self, area=None) -> bool:
         """
-        Sends the request to send_action to arm an area.
+        Sends the request to send_action to stay an area.
         params:\n\tarea (int): The number of the area to apply the zone to.
         """
-        post_data = {"actionCmd": "area-stay", "actionNum": area}
-        return await self.send_action(post_data)
+        return await self.area_action("stay", area)
 
     async def disarm_area(self, area=None) -> bool:
         """
-        Sends the request to send_action to arm an area.
+        Sends the request to send_action to disarm an area.
         params:\n\tarea (int): The number of the area to apply the zone to.
         """
-        post_data = {"actionCmd": "area-disarm", "actionNum": area}
-        return await self.send_action(post_data)
+        return await self.area_action("disarm", area)
 
     async def bypass_zone(self, zone) -> bool:
         """
@@ -476,19 +613,22 @@ class OlarmApi:
 
         return:\tlist\tThe devices assosiated with the api key.
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://apiv4.olarm.co/api/v4/devices",
-                    headers=self.headers,
-                ) as response:
-                    olarm_resp = await response.json()
+        for attempt in range(2):
+            try:
+                session = await self._get_session()
+                async with session.get(self._url_devices) as response:
+                    olarm_resp = _loads(await response.read())
                     self.devices = olarm_resp["data"]
                     return self.devices
 
-        except APIClientConnectorError as ex:
-            LOGGER.error("Olarm API Devices error\n%s", ex)
-            return []
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+                if attempt == 1:
+                    LOGGER.error("Olarm API Devices error\n%s", ex)
+                    return []
+
+                await asyncio.sleep(0.25 * 2**attempt)
+
+        return []
 
 
 class OlarmSetupApi:
@@ -499,6 +639,8 @@ class OlarmSetupApi:
         \tapi_key (str): The key can be passed in an authorization header to authenticate to Olarm.
     """
 
+    __slots__ = ("data", "headers", "_session", "_url_devices")
+
     def __init__(self, api_key) -> None:
         """
         Initatiates a connection to the Olarm API.
@@ -507,6 +649,32 @@ class OlarmSetupApi:
         """
         self.data = []
         self.headers = {"Authorization": f"Bearer {api_key}"}
+        self._session: aiohttp.ClientSession | None = None
+        self._url_devices = yarl.URL("https://apiv4.olarm.co/api/v4/devices")
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared aiohttp session for the setup api, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=10, keepalive_timeout=75, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+            )
+
+        return self._session
+
+    async def async_close(self) -> None:
+        """
+        Closes the shared aiohttp session once setup is done.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
 
     async def get_olarm_devices(self) -> list:
         """
@@ -514,16 +682,19 @@ class OlarmSetupApi:
 
         return:\tlist\tThe devices assosiated with the api key.
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://apiv4.olarm.co/api/v4/devices",
-                    headers=self.headers,
-                ) as response:
-                    olarm_resp = await response.json()
+        for attempt in range(2):
+            try:
+                session = await self._get_session()
+                async with session.get(self._url_devices) as response:
+                    olarm_resp = _loads(await response.read())
                     self.data = olarm_resp["data"]
                     return self.data
 
-        except APIClientConnectorError as ex:
-            LOGGER.error("Olarm SetupAPI Devices error\n%s", ex)
-            return []
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+                if attempt == 1:
+                    LOGGER.error("Olarm SetupAPI Devices error\n%s", ex)
+                    return []
+
+                await asyncio.sleep(0.25 * 2**attempt)
+
+        return []